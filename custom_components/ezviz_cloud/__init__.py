@@ -1,6 +1,8 @@
 """Support for EZVIZ camera."""
 
 import logging
+import time
+from typing import Any
 
 from pyezvizapi.client import EzvizClient
 from pyezvizapi.exceptions import (
@@ -19,8 +21,10 @@ from homeassistant.const import (
     CONF_URL,
     Platform,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     ATTR_TYPE_CAMERA,
@@ -29,15 +33,19 @@ from .const import (
     CONF_FFMPEG_ARGUMENTS,
     CONF_RF_SESSION_ID,
     CONF_SESSION_ID,
+    CONF_TOKEN_EXPIRY,
     DATA_COORDINATOR,
     DEFAULT_FFMPEG_ARGUMENTS,
     DEFAULT_TIMEOUT,
+    DEFAULT_TOKEN_TTL,
     DOMAIN,
 )
 from .coordinator import EzvizDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 PLATFORMS_BY_TYPE: dict[str, list] = {
     ATTR_TYPE_CAMERA: [],
     ATTR_TYPE_CLOUD: [
@@ -58,9 +66,15 @@ PLATFORMS_BY_TYPE: dict[str, list] = {
 }
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the EZVIZ integration."""
+    hass.data[DOMAIN] = {}
+
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up EZVIZ from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
     sensor_type: str = entry.data[CONF_TYPE]
     ezviz_client = None
 
@@ -74,31 +88,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Initialize EZVIZ cloud entities
     if PLATFORMS_BY_TYPE[sensor_type]:
-        ezviz_client = EzvizClient(
-            token={
-                CONF_SESSION_ID: entry.data[CONF_SESSION_ID],
-                CONF_RF_SESSION_ID: entry.data[CONF_RF_SESSION_ID],
-                "api_url": entry.data[CONF_URL],
-            },
-            timeout=entry.options[CONF_TIMEOUT],
-        )
-
-        try:
-            await hass.async_add_executor_job(ezviz_client.login)
-
-        except (EzvizAuthTokenExpired, EzvizAuthVerificationCode) as error:
-            raise ConfigEntryAuthFailed from error
+        timeout = entry.options.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
+        # pyezvizapi keeps this dict as its token and rotates the ids in place.
+        token = {
+            CONF_SESSION_ID: entry.data[CONF_SESSION_ID],
+            CONF_RF_SESSION_ID: entry.data[CONF_RF_SESSION_ID],
+            "api_url": entry.data[CONF_URL],
+        }
+        ezviz_client = EzvizClient(token=token, timeout=timeout)
 
-        except (InvalidURL, HTTPError, PyEzvizError) as error:
-            raise ConfigEntryNotReady(
-                f"Unable to connect to Ezviz service: {error}"
-            ) from error
+        # Reuse the stored session while it is still fresh to skip the login round-trip.
+        if entry.data.get(CONF_TOKEN_EXPIRY, 0) <= time.time() + 60:
+            await _async_login(hass, ezviz_client)
 
         coordinator = EzvizDataUpdateCoordinator(
-            hass, api=ezviz_client, api_timeout=entry.options[CONF_TIMEOUT]
+            hass, api=ezviz_client, api_timeout=timeout
         )
 
-        await coordinator.async_config_entry_first_refresh()
+        try:
+            await coordinator.async_config_entry_first_refresh()
+
+        finally:
+            # Login and pyezvizapi's own refresh of a rejected session both
+            # rotate the ids, store them even if the first refresh failed.
+            _async_store_session(hass, entry, token)
 
         hass.data[DOMAIN][entry.entry_id] = {DATA_COORDINATOR: coordinator}
 
@@ -121,6 +134,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_login(hass: HomeAssistant, ezviz_client: EzvizClient) -> None:
+    """Refresh the EZVIZ session."""
+    try:
+        await hass.async_add_executor_job(ezviz_client.login)
+
+    except (EzvizAuthTokenExpired, EzvizAuthVerificationCode) as error:
+        raise ConfigEntryAuthFailed from error
+
+    except (InvalidURL, HTTPError, PyEzvizError) as error:
+        raise ConfigEntryNotReady(
+            f"Unable to connect to Ezviz service: {error}"
+        ) from error
+
+
+@callback
+def _async_store_session(
+    hass: HomeAssistant, entry: ConfigEntry, token: dict[str, Any]
+) -> None:
+    """Persist rotated session ids and restart the reuse window."""
+    to_update = {
+        key: token[key]
+        for key in (CONF_SESSION_ID, CONF_RF_SESSION_ID)
+        if token.get(key) and token[key] != entry.data.get(key)
+    }
+    if not to_update:
+        return
+
+    to_update[CONF_TOKEN_EXPIRY] = time.time() + DEFAULT_TOKEN_TTL
+
+    hass.config_entries.async_update_entry(entry, data=entry.data | to_update)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     sensor_type = entry.data[CONF_TYPE]
@@ -3,8 +3,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import timedelta
-import logging
 
 from pyezvizapi import PyEzvizError
 from pyezvizapi.constants import DefenseModeType
@@ -16,35 +14,37 @@ from homeassistant.components.alarm_control_panel import (
     AlarmControlPanelState,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DATA_COORDINATOR, DOMAIN, MANUFACTURER
 from .coordinator import EzvizDataUpdateCoordinator
 
-_LOGGER = logging.getLogger(__name__)
-
-SCAN_INTERVAL = timedelta(seconds=60)
 PARALLEL_UPDATES = 0
 
+_MODE_DISARM = DefenseModeType.HOME_MODE.value
+_MODE_AWAY = DefenseModeType.AWAY_MODE.value
+_MODE_NIGHT = DefenseModeType.SLEEP_MODE.value
+
 
 @dataclass(frozen=True, kw_only=True)
 class EzvizAlarmControlPanelEntityDescription(AlarmControlPanelEntityDescription):
     """Describe an EZVIZ Alarm control panel entity."""
 
-    ezviz_alarm_states: list
+    ezviz_alarm_states: dict[str, AlarmControlPanelState | None]
 
 
 ALARM_TYPE = EzvizAlarmControlPanelEntityDescription(
     key="ezviz_alarm",
-    ezviz_alarm_states=[
-        None,
-        AlarmControlPanelState.DISARMED,
-        AlarmControlPanelState.ARMED_AWAY,
-        AlarmControlPanelState.ARMED_HOME,
-    ],
+    ezviz_alarm_states={
+        "0": None,
+        "1": AlarmControlPanelState.DISARMED,
+        "2": AlarmControlPanelState.ARMED_AWAY,
+        "3": AlarmControlPanelState.ARMED_HOME,
+    },
 )
 
 
@@ -68,7 +68,9 @@ async def async_setup_entry(
     )
 
 
-class EzvizAlarm(AlarmControlPanelEntity):
+class EzvizAlarm(
+    CoordinatorEntity[EzvizDataUpdateCoordinator], AlarmControlPanelEntity
+):
     """Representation of an Ezviz alarm control panel."""
 
     entity_description: EzvizAlarmControlPanelEntityDescription
@@ -88,64 +90,67 @@ class EzvizAlarm(AlarmControlPanelEntity):
         entity_description: EzvizAlarmControlPanelEntityDescription,
     ) -> None:
         """Initialize alarm control panel entity."""
+        super().__init__(coordinator)
         self._attr_unique_id = f"{entry_id}_{entity_description.key}"
         self._attr_device_info = device_info
         self.entity_description = entity_description
-        self.coordinator = coordinator
-        self._attr_alarm_state = None
-
-    async def async_added_to_hass(self) -> None:
-        """Entity added to hass."""
-        self.async_schedule_update_ha_state(True)
-
-    def alarm_disarm(self, code: str | None = None) -> None:
+        self._attr_alarm_state = entity_description.ezviz_alarm_states.get(
+            coordinator.defence_mode
+        )
+        self._last_written: tuple[AlarmControlPanelState | None, bool] = (
+            self._attr_alarm_state,
+            self.available,
+        )
+
+    async def async_alarm_disarm(self, code: str | None = None) -> None:
         """Send disarm command."""
         try:
-            if self.coordinator.ezviz_client.api_set_defence_mode(
-                DefenseModeType.HOME_MODE.value
+            if await self.hass.async_add_executor_job(
+                self.coordinator.ezviz_client.api_set_defence_mode,
+                _MODE_DISARM,
             ):
-                self._attr_alarm_state = AlarmControlPanelState.DISARMED
+                self.coordinator.async_set_defence_mode(str(_MODE_DISARM))
+                await self.coordinator.async_request_refresh()
 
         except PyEzvizError as err:
             raise HomeAssistantError("Cannot disarm EZVIZ alarm") from err
 
-    def alarm_arm_away(self, code: str | None = None) -> None:
+    async def async_alarm_arm_away(self, code: str | None = None) -> None:
         """Send arm away command."""
         try:
-            if self.coordinator.ezviz_client.api_set_defence_mode(
-                DefenseModeType.AWAY_MODE.value
+            if await self.hass.async_add_executor_job(
+                self.coordinator.ezviz_client.api_set_defence_mode,
+                _MODE_AWAY,
             ):
-                self._attr_alarm_state = AlarmControlPanelState.ARMED_AWAY
+                self.coordinator.async_set_defence_mode(str(_MODE_AWAY))
+                await self.coordinator.async_request_refresh()
 
         except PyEzvizError as err:
             raise HomeAssistantError("Cannot arm EZVIZ alarm") from err
 
-    def alarm_arm_home(self, code: str | None = None) -> None:
+    async def async_alarm_arm_home(self, code: str | None = None) -> None:
         """Send arm home command."""
         try:
-            if self.coordinator.ezviz_client.api_set_defence_mode(
-                DefenseModeType.SLEEP_MODE.value
+            if await self.hass.async_add_executor_job(
+                self.coordinator.ezviz_client.api_set_defence_mode,
+                _MODE_NIGHT,
             ):
-                self._attr_alarm_state = AlarmControlPanelState.ARMED_HOME
+                self.coordinator.async_set_defence_mode(str(_MODE_NIGHT))
+                await self.coordinator.async_request_refresh()
 
         except PyEzvizError as err:
             raise HomeAssistantError("Cannot arm EZVIZ alarm") from err
 
-    def update(self) -> None:
-        """Fetch data from EZVIZ."""
-        ezviz_alarm_state_number = "0"
-        try:
-            ezviz_alarm_state_number = (
-                self.coordinator.ezviz_client.get_group_defence_mode()
-            )
-            _LOGGER.debug(
-                "Updating EZVIZ alarm with response %s", ezviz_alarm_state_number
-            )
-            self._attr_alarm_state = self.entity_description.ezviz_alarm_states[
-                int(ezviz_alarm_state_number)
-            ]
-
-        except PyEzvizError as error:
-            raise HomeAssistantError(
-                f"Could not fetch EZVIZ alarm status: {error}"
-            ) from error
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        alarm_state = self.entity_description.ezviz_alarm_states.get(
+            self.coordinator.defence_mode
+        )
+        written = (alarm_state, self.available)
+        if written == self._last_written:
+            return
+
+        self._last_written = written
+        self._attr_alarm_state = alarm_state
+        super()._handle_coordinator_update()
@@ -8,7 +8,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DATA_COORDINATOR, DOMAIN
@@ -42,13 +42,10 @@ async def async_setup_entry(
     ]
 
     async_add_entities(
-        [
-            EzvizBinarySensor(coordinator, camera, binary_sensor)
-            for camera in coordinator.data
-            for binary_sensor, value in coordinator.data[camera].items()
-            if binary_sensor in BINARY_SENSOR_TYPES
-            if value is not None
-        ]
+        EzvizBinarySensor(coordinator, camera, binary_sensor)
+        for camera, camera_data in coordinator.data.items()
+        for binary_sensor in BINARY_SENSOR_TYPES
+        if camera_data.get(binary_sensor) is not None
     )
 
 
@@ -66,8 +63,17 @@ class EzvizBinarySensor(EzvizEntity, BinarySensorEntity):
         self._sensor_name = binary_sensor
         self._attr_unique_id = f"{serial}_{self._camera_name}.{binary_sensor}"
         self.entity_description = BINARY_SENSOR_TYPES[binary_sensor]
+        self._attr_is_on = self.data[binary_sensor]
+        self._last_written: tuple[bool, bool] = (self._attr_is_on, self.available)
 
-    @property
-    def is_on(self) -> bool:
-        """Return the state of the sensor."""
-        return self.data[self._sensor_name]
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        is_on = self.data[self._sensor_name]
+        written = (is_on, self.available)
+        if written == self._last_written:
+            return
+
+        self._last_written = written
+        self._attr_is_on = is_on
+        super()._handle_coordinator_update()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
 from pyezvizapi import EzvizClient
@@ -31,7 +32,7 @@ class EzvizButtonEntityHandler:
     """Class to handle multi actions for button."""
 
     @staticmethod
-    def press_ptz(pyezviz_client: EzvizClient, direction: str, serial: str) -> Any:
+    def press_ptz(pyezviz_client: EzvizClient, serial: str, *, direction: str) -> Any:
         """Execute the button action for PTZ."""
         pyezviz_client.ptz_control(direction, serial, "START")
         pyezviz_client.ptz_control(direction, serial, "STOP")
@@ -43,39 +44,32 @@ class EzvizButtonEntityDescription(ButtonEntityDescription):
 
     method: Callable[[EzvizClient, str], Any]
     supported_ext: str
+    refresh_after_press: bool = False
 
 
 BUTTON_ENTITIES = (
     EzvizButtonEntityDescription(
         key="ptz_up",
         translation_key="ptz_up",
-        method=lambda pyezviz_client, serial: EzvizButtonEntityHandler.press_ptz(
-            pyezviz_client, "UP", serial
-        ),
+        method=partial(EzvizButtonEntityHandler.press_ptz, direction="UP"),
         supported_ext=str(SupportExt.SupportPtz.value),
     ),
     EzvizButtonEntityDescription(
         key="ptz_down",
         translation_key="ptz_down",
-        method=lambda pyezviz_client, serial: EzvizButtonEntityHandler.press_ptz(
-            pyezviz_client, "DOWN", serial
-        ),
+        method=partial(EzvizButtonEntityHandler.press_ptz, direction="DOWN"),
         supported_ext=str(SupportExt.SupportPtz.value),
     ),
     EzvizButtonEntityDescription(
         key="ptz_left",
         translation_key="ptz_left",
-        method=lambda pyezviz_client, serial: EzvizButtonEntityHandler.press_ptz(
-            pyezviz_client, "LEFT", serial
-        ),
+        method=partial(EzvizButtonEntityHandler.press_ptz, direction="LEFT"),
         supported_ext=str(SupportExt.SupportPtz.value),
     ),
     EzvizButtonEntityDescription(
         key="ptz_right",
         translation_key="ptz_right",
-        method=lambda pyezviz_client, serial: EzvizButtonEntityHandler.press_ptz(
-            pyezviz_client, "RIGHT", serial
-        ),
+        method=partial(EzvizButtonEntityHandler.press_ptz, direction="RIGHT"),
         supported_ext=str(SupportExt.SupportPtz.value),
     ),
     EzvizButtonEntityDescription(
@@ -84,10 +78,25 @@ BUTTON_ENTITIES = (
         translation_key="reboot_device",
         method=lambda pyezviz_client, serial: pyezviz_client.reboot_camera(serial),
         supported_ext=str(SupportExt.SupportRebootDevice.value),
+        refresh_after_press=True,
     ),
 )
 
 
+def _group_by_support_ext(
+    descriptions: tuple[EzvizButtonEntityDescription, ...],
+) -> dict[str, tuple[EzvizButtonEntityDescription, ...]]:
+    """Group button descriptions by supportExt key, keeping their order."""
+    grouped: dict[str, list[EzvizButtonEntityDescription]] = {}
+    for description in descriptions:
+        grouped.setdefault(description.supported_ext, []).append(description)
+
+    return {key: tuple(group) for key, group in grouped.items()}
+
+
+BUTTON_ENTITIES_BY_SUPPORT_EXT = _group_by_support_ext(BUTTON_ENTITIES)
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
@@ -102,11 +111,10 @@ async def async_setup_entry(
 
     async_add_entities(
         EzvizButtonEntity(coordinator, camera, entity_description)
-        for camera in coordinator.data
-        for capability, value in coordinator.data[camera]["supportExt"].items()
-        for entity_description in BUTTON_ENTITIES
-        if capability == entity_description.supported_ext
-        if value == "1"
+        for camera, camera_data in coordinator.data.items()
+        for capability, descriptions in BUTTON_ENTITIES_BY_SUPPORT_EXT.items()
+        if camera_data["supportExt"].get(capability) == "1"
+        for entity_description in descriptions
     )
 
 
@@ -125,11 +133,20 @@ class EzvizButtonEntity(EzvizEntity, ButtonEntity):
         super().__init__(coordinator, serial)
         self._attr_unique_id = f"{serial}_{description.key}"
         self.entity_description = description
+        self._client = coordinator.ezviz_client
 
-    def press(self) -> None:
+    async def async_press(self) -> None:
         """Execute the button action."""
         try:
-            self.entity_description.method(self.coordinator.ezviz_client, self._serial)
+            await self.hass.async_add_executor_job(
+                self.entity_description.method,
+                self._client,
+                self._serial,
+            )
 
         except (HTTPError, PyEzvizError) as err:
             raise HomeAssistantError(f"Cannot perform action on {self.name}") from err
+
+        # Only a reboot changes reported state (the camera drops offline).
+        if self.entity_description.refresh_after_press:
+            await self.coordinator.async_request_refresh()
@@ -8,7 +8,6 @@ from pyezvizapi.exceptions import HTTPError, InvalidHost, PyEzvizError
 
 from homeassistant.components import ffmpeg
 from homeassistant.components.camera import Camera, CameraEntityFeature
-from homeassistant.components.ffmpeg import get_ffmpeg_manager
 from homeassistant.components.stream import CONF_USE_WALLCLOCK_AS_TIMESTAMPS
 from homeassistant.config_entries import (
     SOURCE_IGNORE,
@@ -16,7 +15,7 @@ from homeassistant.config_entries import (
     ConfigEntry,
 )
 from homeassistant.const import CONF_IP_ADDRESS, CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import discovery_flow
 from homeassistant.helpers.entity_platform import (
     AddEntitiesCallback,
@@ -48,27 +47,20 @@ async def async_setup_entry(
     ]
 
     camera_entities = []
+    camera_rtsp_entries: dict[str | None, ConfigEntry] = {}
+    for item in hass.config_entries.async_entries(DOMAIN):
+        if item.source != SOURCE_IGNORE:
+            camera_rtsp_entries.setdefault(item.unique_id, item)
 
     for camera, value in coordinator.data.items():
-        camera_rtsp_entry = [
-            item
-            for item in hass.config_entries.async_entries(DOMAIN)
-            if item.unique_id == camera and item.source != SOURCE_IGNORE
-        ]
-
-        if camera_rtsp_entry:
-            ffmpeg_arguments = camera_rtsp_entry[0].options[CONF_FFMPEG_ARGUMENTS]
-            camera_username = camera_rtsp_entry[0].data[CONF_USERNAME]
-            camera_password = camera_rtsp_entry[0].data[CONF_PASSWORD]
-
-            camera_rtsp_stream = f"rtsp://{camera_username}:{camera_password}@{value['local_ip']}:{value['local_rtsp_port']}{ffmpeg_arguments}"
-            _LOGGER.debug(
-                "Configuring Camera %s with ip: %s rtsp port: %s ffmpeg arguments: %s",
-                camera,
-                value["local_ip"],
-                value["local_rtsp_port"],
-                ffmpeg_arguments,
-            )
+        local_ip = value["local_ip"]
+        local_rtsp_port = value["local_rtsp_port"]
+
+        if camera_rtsp_entry := camera_rtsp_entries.get(camera):
+            camera_entry_data = camera_rtsp_entry.data
+            ffmpeg_arguments = camera_rtsp_entry.options[CONF_FFMPEG_ARGUMENTS]
+            camera_username = camera_entry_data[CONF_USERNAME]
+            camera_password = camera_entry_data[CONF_PASSWORD]
 
         else:
             discovery_flow.async_create_flow(
@@ -77,7 +69,7 @@ async def async_setup_entry(
                 context={"source": SOURCE_INTEGRATION_DISCOVERY},
                 data={
                     ATTR_SERIAL: camera,
-                    CONF_IP_ADDRESS: value["local_ip"],
+                    CONF_IP_ADDRESS: local_ip,
                 },
             )
 
@@ -92,17 +84,14 @@ async def async_setup_entry(
             ffmpeg_arguments = DEFAULT_FFMPEG_ARGUMENTS
             camera_username = DEFAULT_CAMERA_USERNAME
             camera_password = None
-            camera_rtsp_stream = ""
 
         camera_entities.append(
             EzvizCamera(
-                hass,
                 coordinator,
                 camera,
                 camera_username,
                 camera_password,
-                camera_rtsp_stream,
-                value["local_rtsp_port"],
+                local_rtsp_port,
                 ffmpeg_arguments,
             )
         )
@@ -123,12 +112,10 @@ class EzvizCamera(EzvizEntity, Camera):
 
     def __init__(
         self,
-        hass: HomeAssistant,
         coordinator: EzvizDataUpdateCoordinator,
         serial: str,
         camera_username: str,
         camera_password: str | None,
-        camera_rtsp_stream: str | None,
         local_rtsp_port: int,
         ffmpeg_arguments: str | None,
     ) -> None:
@@ -138,38 +125,42 @@ class EzvizCamera(EzvizEntity, Camera):
         self.stream_options[CONF_USE_WALLCLOCK_AS_TIMESTAMPS] = True
         self._username = camera_username
         self._password = camera_password
-        self._rtsp_stream = camera_rtsp_stream
         self._local_rtsp_port = local_rtsp_port
         self._ffmpeg_arguments = ffmpeg_arguments
-        self._ffmpeg = get_ffmpeg_manager(hass)
+        self._client = coordinator.ezviz_client
+        self._rtsp_prefix = f"rtsp://{camera_username}:{camera_password}@"
+        self._rtsp_suffix = f":{local_rtsp_port}{ffmpeg_arguments}"
+        self._rtsp_local_ip: str | None = None
+        self._rtsp_stream: str | None = None
         self._attr_unique_id = serial
         if camera_password:
             self._attr_supported_features = CameraEntityFeature.STREAM
+        self._update_attrs()
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self.data["status"] != 2
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if on."""
-        return bool(self.data["status"])
-
-    @property
-    def is_recording(self) -> bool:
-        """Return true if the device is recording."""
-        return self.data["alarm_notify"]
-
-    @property
-    def motion_detection_enabled(self) -> bool:
-        """Camera Motion Detection Status."""
-        return self.data["alarm_notify"]
+        return self._attr_available
+
+    def _update_attrs(self) -> None:
+        """Copy the camera state from coordinator data."""
+        data = self.data
+        status = data["status"]
+        self._attr_available = status != 2
+        self._attr_is_on = bool(status)
+        self._attr_is_recording = data["alarm_notify"]
+        self._attr_motion_detection_enabled = data["alarm_notify"]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
     def enable_motion_detection(self) -> None:
         """Enable motion detection in camera."""
         try:
-            self.coordinator.ezviz_client.set_camera_defence(self._serial, 1)
+            self._client.set_camera_defence(self._serial, 1)
 
         except InvalidHost as err:
             raise InvalidHost("Error enabling motion detection") from err
@@ -177,7 +168,7 @@ class EzvizCamera(EzvizEntity, Camera):
     def disable_motion_detection(self) -> None:
         """Disable motion detection."""
         try:
-            self.coordinator.ezviz_client.set_camera_defence(self._serial, 0)
+            self._client.set_camera_defence(self._serial, 0)
 
         except InvalidHost as err:
             raise InvalidHost("Error disabling motion detection") from err
@@ -186,34 +177,40 @@ class EzvizCamera(EzvizEntity, Camera):
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
         """Return a frame from the camera stream."""
-        if self._rtsp_stream is None:
+        if self._password is None:
             return None
         return await ffmpeg.async_get_image(
-            self.hass, self._rtsp_stream, width=width, height=height
+            self.hass,
+            self._build_rtsp(),
+            width=width,
+            height=height,
         )
 
     async def stream_source(self) -> str | None:
         """Return the stream source."""
         if self._password is None:
             return None
+        return self._build_rtsp()
+
+    def _build_rtsp(self) -> str:
+        """Return the RTSP url, rebuilding it when the local ip changes."""
         local_ip = self.data["local_ip"]
-        self._rtsp_stream = (
-            f"rtsp://{self._username}:{self._password}@"
-            f"{local_ip}:{self._local_rtsp_port}{self._ffmpeg_arguments}"
-        )
-        _LOGGER.debug(
-            "Configuring Camera %s with ip: %s rtsp port: %s ffmpeg arguments: %s",
-            self._serial,
-            local_ip,
-            self._local_rtsp_port,
-            self._ffmpeg_arguments,
-        )
+        if self._rtsp_stream is None or local_ip != self._rtsp_local_ip:
+            _LOGGER.debug(
+                "Configuring Camera %s with ip: %s rtsp port: %s ffmpeg arguments: %s",
+                self._serial,
+                local_ip,
+                self._local_rtsp_port,
+                self._ffmpeg_arguments,
+            )
+            self._rtsp_local_ip = local_ip
+            self._rtsp_stream = f"{self._rtsp_prefix}{local_ip}{self._rtsp_suffix}"
 
         return self._rtsp_stream
 
     def perform_wake_device(self) -> None:
         """Basically wakes the camera by querying the device."""
         try:
-            self.coordinator.ezviz_client.get_detection_sensibility(self._serial)
+            self._client.get_detection_sensibility(self._serial)
         except (HTTPError, PyEzvizError) as err:
             raise PyEzvizError("Cannot wake device") from err
@@ -43,6 +43,7 @@ from .const import (
     CONF_RF_SESSION_ID,
     CONF_SESSION_ID,
     CONF_TEST_RTSP_CREDENTIALS,
+    DATA_COORDINATOR,
     DEFAULT_CAMERA_USERNAME,
     DEFAULT_FFMPEG_ARGUMENTS,
     DEFAULT_TIMEOUT,
@@ -57,6 +58,33 @@ DEFAULT_OPTIONS = {
     CONF_TIMEOUT: DEFAULT_TIMEOUT,
 }
 
+USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_USERNAME): str,
+        vol.Required(CONF_PASSWORD): str,
+        vol.Required(CONF_URL, default=EU_URL): vol.In(
+            [EU_URL, RUSSIA_URL, CONF_CUSTOMIZE]
+        ),
+    }
+)
+USER_CUSTOM_URL_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_URL, default=EU_URL): str,
+    }
+)
+MFA_CODE_SCHEMA = vol.Schema(
+    {
+        vol.Required("sms_code"): str,
+    }
+)
+DISCOVERED_CAMERA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_USERNAME, default=DEFAULT_CAMERA_USERNAME): str,
+        vol.Required(CONF_PASSWORD, default="fetch_my_key"): str,
+        vol.Optional(CONF_TEST_RTSP_CREDENTIALS, default=True): bool,
+    }
+)
+
 
 def _test_camera_rtsp_creds(data: dict) -> None:
     """Try DESCRIBE on RTSP camera with credentials."""
@@ -78,9 +106,25 @@ def _wake_camera(data: dict, ezviz_client) -> None:
     _test_camera_rtsp_creds(data)
 
 
-def _get_cam_enc_key(data: dict, ezviz_client: EzvizClient) -> Any:
-    """Get camera encryption key."""
-    return ezviz_client.get_cam_key(data[ATTR_SERIAL])
+def _login_ezviz_client(token: dict, timeout: int) -> EzvizClient:
+    """Create EZVIZ client from stored token and login."""
+    ezviz_client = EzvizClient(token=token, timeout=timeout)
+    ezviz_client.login()
+
+    return ezviz_client
+
+
+def _get_cam_enc_key_and_test(data: dict, ezviz_client: EzvizClient) -> None:
+    """Get camera encryption key and test camera RTSP credentials."""
+    data[CONF_ENC_KEY] = ezviz_client.get_cam_key(data[ATTR_SERIAL])
+
+    # If newer camera, the encryption key is the password.
+    if data[CONF_PASSWORD] == "fetch_my_key":
+        data[CONF_PASSWORD] = data[CONF_ENC_KEY]
+
+    # Test camera RTSP credentials. Older cameras still use the verification code on the camera and not the encryption key.
+    if data[CONF_TEST_RTSP_CREDENTIALS]:
+        _wake_camera(data, ezviz_client)
 
 
 class EzvizConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -93,7 +137,7 @@ class EzvizConfigFlow(ConfigFlow, domain=DOMAIN):
     password: str | None
     ezviz_url: str | None
     unique_id: str
-    ezviz_client: EzvizClient
+    ezviz_client: EzvizClient | None = None
     entry_data: ConfigEntry
 
     def _validate_and_create_auth(self, data: dict) -> dict[str, Any]:
@@ -101,12 +145,15 @@ class EzvizConfigFlow(ConfigFlow, domain=DOMAIN):
         # Verify cloud credentials by attempting a login request with username and password.
         # Return login token.
 
-        self.ezviz_client = EzvizClient(
-            data[CONF_USERNAME],
-            data[CONF_PASSWORD],
-            data[CONF_URL],
-            data.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
-        )
+        # MFA steps resubmit the credentials of the login that asked for the
+        # code, so keep that client and its session.
+        if data.get("sms_code") is None or self.ezviz_client is None:
+            self.ezviz_client = EzvizClient(
+                data[CONF_USERNAME],
+                data[CONF_PASSWORD],
+                data[CONF_URL],
+                data.get(CONF_TIMEOUT, DEFAULT_TIMEOUT),
+            )
 
         ezviz_token = self.ezviz_client.login(sms_code=data.get("sms_code"))
 
@@ -128,6 +175,7 @@ class EzvizConfigFlow(ConfigFlow, domain=DOMAIN):
             "api_url": None,
         }
         ezviz_timeout = DEFAULT_TIMEOUT
+        ezviz_client: EzvizClient | None = None
 
         for item in self._async_current_entries():
             if item.data.get(CONF_TYPE) == ATTR_TYPE_CLOUD:
@@ -138,28 +186,25 @@ class EzvizConfigFlow(ConfigFlow, domain=DOMAIN):
                 }
                 ezviz_timeout = item.data.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
 
+                # Share the loaded account's client and its open connection.
+                if entry_data := self.hass.data.get(DOMAIN, {}).get(item.entry_id):
+                    ezviz_client = entry_data[DATA_COORDINATOR].ezviz_client
+
         # Abort flow if user removed cloud account before adding camera.
         if ezviz_token.get(CONF_SESSION_ID) is None:
             return self.async_abort(reason="ezviz_cloud_account_missing")
 
-        ezviz_client = EzvizClient(token=ezviz_token, timeout=ezviz_timeout)
-
-        # Create Ezviz API Client.
-        await self.hass.async_add_executor_job(ezviz_client.login)
+        if ezviz_client is None:
+            # Create Ezviz API Client.
+            ezviz_client = await self.hass.async_add_executor_job(
+                _login_ezviz_client, ezviz_token, ezviz_timeout
+            )
 
-        # Fetch encryption key from ezviz api.
-        data[CONF_ENC_KEY] = await self.hass.async_add_executor_job(
-            _get_cam_enc_key, data, ezviz_client
+        # Fetch encryption key from ezviz api and test the camera in one job.
+        await self.hass.async_add_executor_job(
+            _get_cam_enc_key_and_test, data, ezviz_client
         )
 
-        # If newer camera, the encryption key is the password.
-        if data[CONF_PASSWORD] == "fetch_my_key":
-            data[CONF_PASSWORD] = data[CONF_ENC_KEY]
-
-        # Test camera RTSP credentials. Older cameras still use the verification code on the camera and not the encryption key.
-        if data[CONF_TEST_RTSP_CREDENTIALS]:
-            await self.hass.async_add_executor_job(_wake_camera, data, ezviz_client)
-
         return self.async_create_entry(
             title=data[ATTR_SERIAL],
             data={
@@ -171,6 +216,15 @@ class EzvizConfigFlow(ConfigFlow, domain=DOMAIN):
             options=DEFAULT_OPTIONS,
         )
 
+    @callback
+    def _async_create_cloud_entry(self, auth_data: dict[str, Any]) -> ConfigFlowResult:
+        """Create the EZVIZ cloud account entry from login data."""
+        return self.async_create_entry(
+            title=auth_data[CONF_USERNAME],
+            data=auth_data,
+            options=DEFAULT_OPTIONS,
+        )
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry: ConfigEntry) -> EzvizOptionsFlowHandler:
@@ -227,24 +281,10 @@ class EzvizConfigFlow(ConfigFlow, domain=DOMAIN):
                 return self.async_abort(reason="unknown")
 
             else:
-                return self.async_create_entry(
-                    title=user_input[CONF_USERNAME],
-                    data=auth_data,
-                    options=DEFAULT_OPTIONS,
-                )
-
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_USERNAME): str,
-                vol.Required(CONF_PASSWORD): str,
-                vol.Required(CONF_URL, default=EU_URL): vol.In(
-                    [EU_URL, RUSSIA_URL, CONF_CUSTOMIZE]
-                ),
-            }
-        )
+                return self._async_create_cloud_entry(auth_data)
 
         return self.async_show_form(
-            step_id="user", data_schema=data_schema, errors=errors
+            step_id="user", data_schema=USER_SCHEMA, errors=errors
         )
 
     async def async_step_user_custom_url(
@@ -282,20 +322,10 @@ class EzvizConfigFlow(ConfigFlow, domain=DOMAIN):
                 return self.async_abort(reason="unknown")
 
             else:
-                return self.async_create_entry(
-                    title=user_input[CONF_USERNAME],
-                    data=auth_data,
-                    options=DEFAULT_OPTIONS,
-                )
-
-        data_schema_custom_url = vol.Schema(
-            {
-                vol.Required(CONF_URL, default=EU_URL): str,
-            }
-        )
+                return self._async_create_cloud_entry(auth_data)
 
         return self.async_show_form(
-            step_id="user_custom_url", data_schema=data_schema_custom_url, errors=errors
+            step_id="user_custom_url", data_schema=USER_CUSTOM_URL_SCHEMA, errors=errors
         )
 
     async def async_step_integration_discovery(
@@ -340,17 +370,9 @@ class EzvizConfigFlow(ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 return self.async_abort(reason="unknown")
 
-        discovered_camera_schema = vol.Schema(
-            {
-                vol.Required(CONF_USERNAME, default=DEFAULT_CAMERA_USERNAME): str,
-                vol.Required(CONF_PASSWORD, default="fetch_my_key"): str,
-                vol.Optional(CONF_TEST_RTSP_CREDENTIALS, default=True): bool,
-            }
-        )
-
         return self.async_show_form(
             step_id="confirm",
-            data_schema=discovered_camera_schema,
+            data_schema=DISCOVERED_CAMERA_SCHEMA,
             errors=errors,
             description_placeholders={
                 ATTR_SERIAL: self.unique_id,
@@ -362,6 +384,12 @@ class EzvizConfigFlow(ConfigFlow, domain=DOMAIN):
         self, entry_data: Mapping[str, Any]
     ) -> ConfigFlowResult:
         """Handle a flow for reauthentication with password."""
+        entry = self._get_reauth_entry()
+        if entry.data.get(CONF_TYPE) != ATTR_TYPE_CLOUD:
+            return self.async_abort(reason="ezviz_cloud_account_missing")
+
+        self.context["title_placeholders"] = {ATTR_SERIAL: entry.title}
+        await self.async_set_unique_id(entry.unique_id)
 
         return await self.async_step_reauth_confirm()
 
@@ -371,15 +399,7 @@ class EzvizConfigFlow(ConfigFlow, domain=DOMAIN):
         """Handle a Confirm flow for reauthentication with password."""
         auth_data = {}
         errors = {}
-        entry = None
-
-        for item in self._async_current_entries():
-            if item.data.get(CONF_TYPE) == ATTR_TYPE_CLOUD:
-                self.context["title_placeholders"] = {ATTR_SERIAL: item.title}
-                entry = await self.async_set_unique_id(item.unique_id)
-
-        if not entry:
-            return self.async_abort(reason="ezviz_cloud_account_missing")
+        entry = self._get_reauth_entry()
 
         if user_input is not None:
             user_input[CONF_URL] = entry.data[CONF_URL]
@@ -467,15 +487,9 @@ class EzvizConfigFlow(ConfigFlow, domain=DOMAIN):
                     data=auth_data,
                 )
 
-        data_schema_mfa_code = vol.Schema(
-            {
-                vol.Required("sms_code"): str,
-            }
-        )
-
         return self.async_show_form(
             step_id="reauth_mfa",
-            data_schema=data_schema_mfa_code,
+            data_schema=MFA_CODE_SCHEMA,
             errors=errors,
         )
 
@@ -513,20 +527,10 @@ class EzvizConfigFlow(ConfigFlow, domain=DOMAIN):
                 return self.async_abort(reason="unknown")
 
             else:
-                return self.async_create_entry(
-                    title=user_input[CONF_USERNAME],
-                    data=auth_data,
-                    options=DEFAULT_OPTIONS,
-                )
-
-        data_schema_mfa_code = vol.Schema(
-            {
-                vol.Required("sms_code"): str,
-            }
-        )
+                return self._async_create_cloud_entry(auth_data)
 
         return self.async_show_form(
-            step_id="user_mfa_confirm", data_schema=data_schema_mfa_code, errors=errors
+            step_id="user_mfa_confirm", data_schema=MFA_CODE_SCHEMA, errors=errors
         )
 
 
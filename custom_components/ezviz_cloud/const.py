@@ -10,6 +10,7 @@ ATTR_TYPE_CLOUD = "EZVIZ_CLOUD_ACCOUNT"
 ATTR_TYPE_CAMERA = "CAMERA_ACCOUNT"
 CONF_SESSION_ID = "session_id"
 CONF_RF_SESSION_ID = "rf_session_id"
+CONF_TOKEN_EXPIRY = "token_expiry"
 CONF_EZVIZ_ACCOUNT = "ezviz_account"
 CONF_ENC_KEY = "enc_key"
 CONF_TEST_RTSP_CREDENTIALS = "test_rtsp_credentials"
@@ -23,6 +24,10 @@ RUSSIA_URL = "apirus.ezvizru.com"
 DEFAULT_CAMERA_USERNAME = "admin"
 DEFAULT_TIMEOUT = 25
 DEFAULT_FFMPEG_ARGUMENTS = ""
+# EZVIZ does not report a session lifetime. A stale stored session costs one
+# rejected request before pyezvizapi refreshes it, so this only bounds how long
+# a stored session is reused before it is refreshed up front at setup.
+DEFAULT_TOKEN_TTL = 43200
 
 # Data
 DATA_COORDINATOR = "coordinator"
@@ -3,6 +3,8 @@
 import asyncio
 from datetime import timedelta
 import logging
+import sys
+import time
 
 from pyezvizapi.client import EzvizClient
 from pyezvizapi.exceptions import (
@@ -13,14 +15,18 @@ from pyezvizapi.exceptions import (
     PyEzvizError,
 )
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+REQUEST_REFRESH_COOLDOWN = 2.0
+DEFENCE_MODE_SCAN_INTERVAL = 60.0
+
 
 class EzvizDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching EZVIZ data."""
@@ -30,17 +36,61 @@ class EzvizDataUpdateCoordinator(DataUpdateCoordinator):
     ) -> None:
         """Initialize global EZVIZ data updater."""
         self.ezviz_client = api
+        self.defence_mode: str | None = None
+        self._defence_mode_polled: float | None = None
         self._api_timeout = api_timeout
         update_interval = timedelta(seconds=30)
 
-        super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=update_interval)
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=update_interval,
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
+        )
+
+    def _load_data(self, poll_defence_mode: bool) -> tuple[dict, str | None]:
+        """Load cameras and, when due, the account defence mode."""
+        # Interned serials let entity lookups into coordinator.data match by
+        # identity, since entities keep the key objects seen at setup.
+        cameras = {
+            sys.intern(serial): camera
+            for serial, camera in self.ezviz_client.load_cameras().items()
+        }
+        if not poll_defence_mode:
+            return cameras, None
+
+        # A failing alarm endpoint only affects the alarm panel.
+        try:
+            defence_mode = str(self.ezviz_client.get_group_defence_mode())
+
+        except (EzvizAuthTokenExpired, EzvizAuthVerificationCode):
+            raise
+
+        except (HTTPError, PyEzvizError) as error:
+            _LOGGER.warning("Unable to fetch EZVIZ alarm state: %s", error)
+            return cameras, None
+
+        _LOGGER.debug("Updating EZVIZ alarm with response %s", defence_mode)
+
+        return cameras, defence_mode
 
     async def _async_update_data(self) -> dict:
         """Fetch data from EZVIZ."""
+        now = time.monotonic()
+        poll_defence_mode = (
+            self._defence_mode_polled is None
+            or now - self._defence_mode_polled >= DEFENCE_MODE_SCAN_INTERVAL
+        )
+        if poll_defence_mode:
+            self._defence_mode_polled = now
+
         try:
             async with asyncio.timeout(self._api_timeout):
-                return await self.hass.async_add_executor_job(
-                    self.ezviz_client.load_cameras
+                cameras, defence_mode = await self.hass.async_add_executor_job(
+                    self._load_data, poll_defence_mode
                 )
 
         except (EzvizAuthTokenExpired, EzvizAuthVerificationCode) as error:
@@ -48,3 +98,15 @@ class EzvizDataUpdateCoordinator(DataUpdateCoordinator):
 
         except (InvalidURL, HTTPError, PyEzvizError) as error:
             raise UpdateFailed(f"Invalid response from API: {error}") from error
+
+        if poll_defence_mode:
+            self.defence_mode = defence_mode
+
+        return cameras
+
+    @callback
+    def async_set_defence_mode(self, defence_mode: str) -> None:
+        """Apply a defence mode set by a command and re-read it on next refresh."""
+        self.defence_mode = defence_mode
+        self._defence_mode_polled = None
+        self.async_update_listeners()
@@ -25,16 +25,17 @@ class EzvizEntity(CoordinatorEntity[EzvizDataUpdateCoordinator], Entity):
         """Initialize the entity."""
         super().__init__(coordinator)
         self._serial = serial
-        self._camera_name = self.data["name"]
+        data = self.data
+        self._camera_name = data["name"]
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, serial)},
             connections={
-                (CONNECTION_NETWORK_MAC, self.data["mac_address"]),
+                (CONNECTION_NETWORK_MAC, data["mac_address"]),
             },
             manufacturer=MANUFACTURER,
-            model=self.data["device_sub_category"],
-            name=self.data["name"],
-            sw_version=self.data["version"],
+            model=data["device_sub_category"],
+            name=data["name"],
+            sw_version=data["version"],
         )
 
     @property
@@ -56,16 +57,17 @@ class EzvizBaseEntity(Entity):
         """Initialize the entity."""
         self._serial = serial
         self.coordinator = coordinator
-        self._camera_name = self.data["name"]
+        data = self.data
+        self._camera_name = data["name"]
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, serial)},
             connections={
-                (CONNECTION_NETWORK_MAC, self.data["mac_address"]),
+                (CONNECTION_NETWORK_MAC, data["mac_address"]),
             },
             manufacturer=MANUFACTURER,
-            model=self.data["device_sub_category"],
-            name=self.data["name"],
-            sw_version=self.data["version"],
+            model=data["device_sub_category"],
+            name=data["name"],
+            sw_version=data["version"],
         )
 
     @property
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from pyezvizapi.exceptions import PyEzvizError
@@ -60,6 +61,12 @@ class EzvizLastMotion(EzvizEntity, ImageEntity):
             if camera and camera.source != SOURCE_IGNORE
             else None
         )
+        self._image_lock = asyncio.Lock()
+
+    async def async_image(self) -> bytes | None:
+        """Return bytes of image, fetching each new url only once."""
+        async with self._image_lock:
+            return await super().async_image()
 
     async def _async_load_image_from_url(self, url: str) -> Image | None:
         """Load an image by url."""
@@ -85,16 +92,15 @@ class EzvizLastMotion(EzvizEntity, ImageEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if (
-            self.data["last_alarm_pic"]
-            and self.data["last_alarm_pic"] != self._attr_image_url
-        ):
-            _LOGGER.debug("Image url changed to %s", self.data["last_alarm_pic"])
+        data = self.data
+        last_alarm_pic = data["last_alarm_pic"]
+        if last_alarm_pic and last_alarm_pic != self._attr_image_url:
+            _LOGGER.debug("Image url changed to %s", last_alarm_pic)
 
-            self._attr_image_url = self.data["last_alarm_pic"]
+            self._attr_image_url = last_alarm_pic
             self._cached_image = None
             self._attr_image_last_updated = dt_util.parse_datetime(
-                str(self.data["last_alarm_time"])
+                str(data["last_alarm_time"])
             )
 
         super()._handle_coordinator_update()
@@ -23,6 +23,7 @@ from .entity import EzvizEntity
 
 PARALLEL_UPDATES = 1
 BRIGHTNESS_RANGE = (1, 255)
+SUPPORT_EXT_ALARM_LIGHT = str(SupportExt.SupportAlarmLight.value)
 
 
 async def async_setup_entry(
@@ -35,10 +36,8 @@ async def async_setup_entry(
 
     async_add_entities(
         EzvizLight(coordinator, camera)
-        for camera in coordinator.data
-        for capability, value in coordinator.data[camera]["supportExt"].items()
-        if capability == str(SupportExt.SupportAlarmLight.value)
-        if value == "1"
+        for camera, camera_data in coordinator.data.items()
+        if camera_data["supportExt"].get(SUPPORT_EXT_ALARM_LIGHT) == "1"
     )
 
 
@@ -36,7 +36,7 @@ class EzvizNumberEntityDescription(NumberEntityDescription):
     """Describe a EZVIZ Number."""
 
     supported_ext: str
-    supported_ext_value: list
+    supported_ext_value: frozenset[str]
 
 
 NUMBER_TYPE = EzvizNumberEntityDescription(
@@ -47,7 +47,7 @@ NUMBER_TYPE = EzvizNumberEntityDescription(
     native_min_value=0,
     native_step=1,
     supported_ext=str(SupportExt.SupportSensibilityAdjust.value),
-    supported_ext_value=["1", "3"],
+    supported_ext_value=frozenset({"1", "3"}),
 )
 
 
@@ -61,10 +61,9 @@ async def async_setup_entry(
 
     async_add_entities(
         EzvizSensor(coordinator, camera, value, entry.entry_id)
-        for camera in coordinator.data
-        for capability, value in coordinator.data[camera]["supportExt"].items()
-        if capability == NUMBER_TYPE.supported_ext
-        if value in NUMBER_TYPE.supported_ext_value
+        for camera, camera_data in coordinator.data.items()
+        if (value := camera_data["supportExt"].get(NUMBER_TYPE.supported_ext))
+        in NUMBER_TYPE.supported_ext_value
     )
 
 
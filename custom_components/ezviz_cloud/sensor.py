@@ -80,13 +80,11 @@ async def async_setup_entry(
     ]
 
     async_add_entities(
-        [
-            EzvizSensor(coordinator, camera, sensor)
-            for camera in coordinator.data
-            for sensor, value in coordinator.data[camera].items()
-            if sensor in SENSOR_TYPES
-            if value is not None
-        ]
+        EzvizSensor(coordinator, camera, sensor)
+        for camera in coordinator.data
+        for sensor, value in coordinator.data[camera].items()
+        if sensor in SENSOR_TYPES
+        if value is not None
     )
 
 
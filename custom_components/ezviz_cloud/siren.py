@@ -27,6 +27,7 @@ from .entity import EzvizBaseEntity
 
 PARALLEL_UPDATES = 1
 OFF_DELAY = timedelta(seconds=60)  # Camera firmware has hard coded turn off.
+SUPPORT_EXT_ACTIVE_DEFENSE = str(SupportExt.SupportActiveDefense.value)
 
 SIREN_ENTITY_TYPE = SirenEntityDescription(
     key="siren",
@@ -44,10 +45,8 @@ async def async_setup_entry(
 
     async_add_entities(
         EzvizSirenEntity(coordinator, camera, SIREN_ENTITY_TYPE)
-        for camera in coordinator.data
-        for capability, value in coordinator.data[camera]["supportExt"].items()
-        if capability == str(SupportExt.SupportActiveDefense.value)
-        if value != "0"
+        for camera, camera_data in coordinator.data.items()
+        if camera_data["supportExt"].get(SUPPORT_EXT_ACTIVE_DEFENSE, "0") != "0"
     )
 
 
@@ -227,11 +227,14 @@ class EzvizOtherSwitches(EzvizEntity, SwitchEntity):
         self._attr_unique_id = f"{serial}_{self.entity_description.key}"
         self._attr_is_on = self.data[switch]
 
-    def turn_on(self, **kwargs: Any) -> None:
+    async def async_turn_on(self, **kwargs: Any) -> None:
         """Change a device switch on the camera."""
         try:
-            self.entity_description.method(
-                self.coordinator.ezviz_client, self._serial, 1
+            await self.hass.async_add_executor_job(
+                self.entity_description.method,
+                self.coordinator.ezviz_client,
+                self._serial,
+                1,
             )
 
             self._attr_is_on = True
@@ -240,11 +243,14 @@ class EzvizOtherSwitches(EzvizEntity, SwitchEntity):
         except (HTTPError, PyEzvizError) as err:
             raise HomeAssistantError(f"Failed to turn on switch {self.name}") from err
 
-    def turn_off(self, **kwargs: Any) -> None:
+    async def async_turn_off(self, **kwargs: Any) -> None:
         """Change a device switch on the camera."""
         try:
-            self.entity_description.method(
-                self.coordinator.ezviz_client, self._serial, 0
+            await self.hass.async_add_executor_job(
+                self.entity_description.method,
+                self.coordinator.ezviz_client,
+                self._serial,
+                0,
             )
 
             self._attr_is_on = False
@@ -1,12 +1,12 @@
 """Tests for the Ezviz integration."""
 from unittest.mock import patch
 
-from homeassistant.components.ezviz.const import (
+from custom_components.ezviz_cloud.const import (
     ATTR_SERIAL,
     ATTR_TYPE_CAMERA,
     ATTR_TYPE_CLOUD,
     CONF_FFMPEG_ARGUMENTS,
-    CONF_RFSESSION_ID,
+    CONF_RF_SESSION_ID,
     CONF_SESSION_ID,
     DEFAULT_FFMPEG_ARGUMENTS,
     DEFAULT_TIMEOUT,
@@ -22,11 +22,11 @@ from homeassistant.const import (
 )
 from homeassistant.core import HomeAssistant
 
-from tests.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 ENTRY_CONFIG = {
     CONF_SESSION_ID: "test-username",
-    CONF_RFSESSION_ID: "test-password",
+    CONF_RF_SESSION_ID: "test-password",
     CONF_URL: "apiieu.ezvizlife.com",
     CONF_TYPE: ATTR_TYPE_CLOUD,
 }
@@ -76,7 +76,7 @@ TEST = {
 
 API_LOGIN_RETURN_VALIDATE = {
     CONF_SESSION_ID: "fake_token",
-    CONF_RFSESSION_ID: "fake_rf_token",
+    CONF_RF_SESSION_ID: "fake_rf_token",
     CONF_URL: "apiieu.ezvizlife.com",
     CONF_TYPE: ATTR_TYPE_CLOUD,
 }
@@ -84,7 +84,7 @@ API_LOGIN_RETURN_VALIDATE = {
 
 def _patch_async_setup_entry(return_value=True):
     return patch(
-        "homeassistant.components.ezviz.async_setup_entry",
+        "custom_components.ezviz_cloud.async_setup_entry",
         return_value=return_value,
     )
 
@@ -1,8 +1,8 @@
 """Define fixtures available for all tests."""
 from unittest.mock import MagicMock, patch
 
-from pyezviz import EzvizClient
-from pyezviz.test_cam_rtsp import TestRTSPAuth
+from pyezvizapi import EzvizClient
+from pyezvizapi.test_cam_rtsp import TestRTSPAuth
 from pytest import fixture
 
 ezviz_login_token_return = {
@@ -12,6 +12,12 @@ ezviz_login_token_return = {
 }
 
 
+@fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable the custom integration in every test."""
+    yield
+
+
 @fixture(autouse=True)
 def mock_ffmpeg(hass):
     """Mock ffmpeg is loaded."""
@@ -22,7 +28,7 @@ def mock_ffmpeg(hass):
 def ezviz_test_rtsp_config_flow(hass):
     """Mock the EzvizApi for easier testing."""
     with patch.object(TestRTSPAuth, "main", return_value=True), patch(
-        "homeassistant.components.ezviz.config_flow.TestRTSPAuth"
+        "custom_components.ezviz_cloud.config_flow.TestRTSPAuth"
     ) as mock_ezviz_test_rtsp:
         instance = mock_ezviz_test_rtsp.return_value = TestRTSPAuth(
             "test-ip",
@@ -39,7 +45,7 @@ def ezviz_test_rtsp_config_flow(hass):
 def ezviz_config_flow(hass):
     """Mock the EzvizAPI for easier config flow testing."""
     with patch.object(EzvizClient, "login", return_value=True), patch(
-        "homeassistant.components.ezviz.config_flow.EzvizClient"
+        "custom_components.ezviz_cloud.config_flow.EzvizClient"
     ) as mock_ezviz:
         instance = mock_ezviz.return_value = EzvizClient(
             "test-username",
@@ -2,7 +2,7 @@
 
 from unittest.mock import patch
 
-from pyezviz.exceptions import (
+from pyezvizapi.exceptions import (
     AuthTestResultFailed,
     EzvizAuthVerificationCode,
     HTTPError,
@@ -11,7 +11,7 @@ from pyezviz.exceptions import (
     PyEzvizError,
 )
 
-from homeassistant.components.ezviz.const import (
+from custom_components.ezviz_cloud.const import (
     ATTR_SERIAL,
     ATTR_TYPE_CAMERA,
     CONF_FFMPEG_ARGUMENTS,
@@ -202,7 +202,7 @@ async def test_async_step_integration_discovery(
     hass, ezviz_config_flow, ezviz_test_rtsp_config_flow
 ):
     """Test discovery and confirm step."""
-    with patch("homeassistant.components.ezviz.PLATFORMS_BY_TYPE", []):
+    with patch("custom_components.ezviz_cloud.PLATFORMS_BY_TYPE", []):
         await init_integration(hass)
 
     result = await hass.config_entries.flow.async_init(
@@ -327,7 +327,7 @@ async def test_discover_exception_step1(
     ezviz_config_flow,
 ):
     """Test we handle unexpected exception on discovery."""
-    with patch("homeassistant.components.ezviz.PLATFORMS_BY_TYPE", []):
+    with patch("custom_components.ezviz_cloud.PLATFORMS_BY_TYPE", []):
         await init_integration(hass)
 
     result = await hass.config_entries.flow.async_init(
@@ -416,7 +416,7 @@ async def test_discover_exception_step3(
     ezviz_test_rtsp_config_flow,
 ):
     """Test we handle unexpected exception on discovery."""
-    with patch("homeassistant.components.ezviz.PLATFORMS_BY_TYPE", []):
+    with patch("custom_components.ezviz_cloud.PLATFORMS_BY_TYPE", []):
         await init_integration(hass)
 
     result = await hass.config_entries.flow.async_init(
@@ -0,0 +1,141 @@
+"""Test the EZVIZ session reuse on setup."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+from pyezvizapi.exceptions import EzvizAuthTokenExpired
+from pytest import fixture
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.ezviz_cloud.const import (
+    ATTR_TYPE_CLOUD,
+    CONF_FFMPEG_ARGUMENTS,
+    CONF_RF_SESSION_ID,
+    CONF_SESSION_ID,
+    CONF_TOKEN_EXPIRY,
+    DEFAULT_FFMPEG_ARGUMENTS,
+    DEFAULT_TIMEOUT,
+    DOMAIN,
+)
+from homeassistant.config_entries import SOURCE_REAUTH, ConfigEntryState
+from homeassistant.const import CONF_TIMEOUT, CONF_TYPE, CONF_URL
+from homeassistant.core import HomeAssistant
+
+ROTATED_TOKEN = {
+    CONF_SESSION_ID: "rotated_token",
+    CONF_RF_SESSION_ID: "rotated_rf_token",
+}
+
+
+def _mock_entry(hass: HomeAssistant, token_expiry: float) -> MockConfigEntry:
+    """Add a cloud account entry with a stored session."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="test-username",
+        version=2,
+        data={
+            CONF_SESSION_ID: "fake_token",
+            CONF_RF_SESSION_ID: "fake_rf_token",
+            CONF_URL: "apiieu.ezvizlife.com",
+            CONF_TYPE: ATTR_TYPE_CLOUD,
+            CONF_TOKEN_EXPIRY: token_expiry,
+        },
+        options={
+            CONF_FFMPEG_ARGUMENTS: DEFAULT_FFMPEG_ARGUMENTS,
+            CONF_TIMEOUT: DEFAULT_TIMEOUT,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    return entry
+
+
+def _rotate_token(mock_ezviz: MagicMock) -> dict:
+    """Rotate the session ids in place, like pyezvizapi does."""
+    token = mock_ezviz.call_args.kwargs["token"]
+    token.update(ROTATED_TOKEN)
+
+    return token
+
+
+@fixture
+def ezviz_client(enable_custom_integrations):
+    """Mock the EZVIZ client used by the cloud account entry."""
+    with (
+        patch("custom_components.ezviz_cloud.EzvizClient") as mock_ezviz,
+        patch("homeassistant.config_entries.ConfigEntries.async_forward_entry_setups"),
+    ):
+        instance = mock_ezviz.return_value
+        instance.login.side_effect = lambda: _rotate_token(mock_ezviz)
+        instance.load_cameras.return_value = {}
+        instance.get_group_defence_mode.return_value = 0
+
+        yield mock_ezviz
+
+
+async def test_setup_reuses_fresh_session(hass: HomeAssistant, ezviz_client) -> None:
+    """Test a fresh stored session is used without logging in."""
+    token_expiry = time.time() + 3600
+    entry = _mock_entry(hass, token_expiry)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    ezviz_client.return_value.login.assert_not_called()
+    assert entry.data[CONF_SESSION_ID] == "fake_token"
+    assert entry.data[CONF_TOKEN_EXPIRY] == token_expiry
+
+
+async def test_setup_refreshes_expired_session(
+    hass: HomeAssistant, ezviz_client
+) -> None:
+    """Test an expired stored session is refreshed and stored."""
+    entry = _mock_entry(hass, time.time() - 1)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    ezviz_client.return_value.login.assert_called_once()
+    assert entry.data[CONF_SESSION_ID] == "rotated_token"
+    assert entry.data[CONF_RF_SESSION_ID] == "rotated_rf_token"
+    assert entry.data[CONF_TOKEN_EXPIRY] > time.time()
+
+
+async def test_setup_stores_session_rotated_by_client(
+    hass: HomeAssistant, ezviz_client
+) -> None:
+    """Test a cached session rejected and refreshed by pyezvizapi is stored."""
+    entry = _mock_entry(hass, time.time() + 3600)
+
+    def _load_cameras() -> dict:
+        _rotate_token(ezviz_client)
+        return {}
+
+    ezviz_client.return_value.load_cameras.side_effect = _load_cameras
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    ezviz_client.return_value.login.assert_not_called()
+    assert entry.data[CONF_SESSION_ID] == "rotated_token"
+    assert entry.data[CONF_RF_SESSION_ID] == "rotated_rf_token"
+
+
+async def test_setup_rejected_session_starts_reauth(
+    hass: HomeAssistant, ezviz_client
+) -> None:
+    """Test a cached session that can no longer be refreshed starts reauth."""
+    entry = _mock_entry(hass, time.time() + 3600)
+    ezviz_client.return_value.load_cameras.side_effect = EzvizAuthTokenExpired
+
+    assert not await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.SETUP_ERROR
+    ezviz_client.return_value.login.assert_not_called()
+    assert ezviz_client.return_value.load_cameras.call_count == 1
+    flows = hass.config_entries.flow.async_progress_by_handler(DOMAIN)
+    assert [flow["context"]["source"] for flow in flows] == [SOURCE_REAUTH]